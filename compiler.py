@@ -7,6 +7,11 @@ Main program that orchestrates the compilation process and
 demonstrates the Symbol Table Manager functionality.
 """
 
+import contextlib
+import io
+import mmap
+import os
+import stat
 import sys
 from pathlib import Path
 from lexer import Lexer
@@ -17,18 +22,39 @@ def compile_file(filepath: str) -> None:
     """
     Compile a source file and display the symbol table.
     
+    The report is collected in memory and written to stdout in one go.
+    
     Args:
         filepath: Path to the source file
     """
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            _compile_file(filepath)
+    finally:
+        sys.stdout.write(buffer.getvalue())
+
+
+def _compile_file(filepath: str) -> None:
+    """Compile a source file, printing the full report."""
     print("\n" + "="*80)
     print("MINI COMPILER - Symbol Table Manager Demo")
     print("Group 6: Compiler Construction Project (CSCS4573)")
     print("="*80)
     
-    # Read source file
+    # Read source file; regular files are decoded straight from a
+    # read-only mapping, without an intermediate bytes copy. Pipes, /proc
+    # files and empty files cannot be mapped and are read normally.
     try:
-        with open(filepath, 'r') as f:
-            source_code = f.read()
+        with open(filepath, 'rb') as f:
+            info = os.fstat(f.fileno())
+            if stat.S_ISREG(info.st_mode) and info.st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    source_code = str(mm, 'utf-8')
+            else:
+                source_code = f.read().decode('utf-8')
+        # Universal newlines, as text mode would give
+        source_code = source_code.replace('\r\n', '\n').replace('\r', '\n')
     except FileNotFoundError:
         print(f"ERROR: File '{filepath}' not found")
         return
@@ -66,7 +92,7 @@ def compile_file(filepath: str) -> None:
     
     # Phase 3: Display Symbol Table
     print("\n[Phase 3: Symbol Table]")
-    symbol_table.display()
+    symbol_table.display(sort=True)
     
     # Display statistics
     stats = symbol_table.get_statistics()
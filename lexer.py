@@ -7,6 +7,8 @@ This module implements the lexical analyzer that breaks source code
 into tokens for further processing.
 """
 
+import re
+import sys
 from enum import Enum, auto
 from dataclasses import dataclass
 from typing import List, Optional
@@ -34,7 +36,15 @@ class TokenType(Enum):
     COMMENT = auto()
 
 
-@dataclass
+# Token types bound once at module level for the hot paths
+_TT_KEYWORD = TokenType.KEYWORD
+_TT_IDENT = TokenType.IDENTIFIER
+_TT_NUM = TokenType.NUMBER
+_TT_STR = TokenType.STRING
+_TT_EOF = TokenType.EOF
+
+
+@dataclass(slots=True)
 class Token:
     """
     Represents a single token from the source code.
@@ -53,6 +63,40 @@ class Token:
         return f"Token({self.type.name}, '{self.value}', line={self.line_number})"
 
 
+# Master token pattern. Whitespace and comments are skipped as the prefix
+# of every match. The token itself is optional, so that the prefix never
+# has to give back a comment's '/' when no token follows it (end of input
+# or an unknown character); such matches have no lastindex. Group names
+# other than the string bodies match TokenType member names.
+_TOKEN_RE = re.compile(r'''
+    (?:[ \t\r\n]+|//[^\n]*)*
+    (?:
+        (?P<NUMBER>\d+(?:\.\d*)?)
+      | (?P<STRING>"(?P<DQ_BODY>(?:[^"\\]|\\[\s\S])*)"?
+                  |'(?P<SQ_BODY>(?:[^'\\]|\\[\s\S])*)'?)
+      | (?P<IDENTIFIER>[^\W\d]\w*)
+      | (?P<OPERATOR>==|!=|<=|>=|\+=|-=|\*=|/=|&&|\|\||[-+*/%=<>!&|])
+      | (?P<DELIMITER>[{}()\[\];,:.])
+    )?
+''', re.VERBOSE)
+
+# Token type for each group index of _TOKEN_RE, indexed by match.lastindex
+_GROUP_TYPES = [None] * (_TOKEN_RE.groups + 1)
+for _name in ('NUMBER', 'STRING', 'IDENTIFIER', 'OPERATOR', 'DELIMITER'):
+    _GROUP_TYPES[_TOKEN_RE.groupindex[_name]] = TokenType[_name]
+del _name
+
+# Escape sequences inside string literals; any other escaped character
+# stands for itself.
+_ESCAPE_RE = re.compile(r'\\([\s\S])')
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r'}
+
+
+def _unescape(body: str) -> str:
+    """Replace escape sequences in a string literal body."""
+    return _ESCAPE_RE.sub(lambda m: _ESCAPES.get(m.group(1), m.group(1)), body)
+
+
 class Lexer:
     """
     Lexical Analyzer for tokenizing source code.
@@ -66,27 +110,30 @@ class Lexer:
     """
     
     # Language keywords
-    KEYWORDS = {
+    KEYWORDS = frozenset({
         'int', 'float', 'string', 'bool',
         'if', 'else', 'elif', 'while', 'for',
         'return', 'break', 'continue',
         'true', 'false', 'null',
         'const', 'function', 'begin', 'end'
-    }
+    })
     
     # Operators
-    OPERATORS = {
+    OPERATORS = frozenset({
         '+', '-', '*', '/', '%',
         '=', '==', '!=', '<', '>', '<=', '>=',
         '&&', '||', '!',
         '+=', '-=', '*=', '/='
-    }
+    })
     
     # Delimiters
-    DELIMITERS = {
+    DELIMITERS = frozenset({
         '{', '}', '(', ')', '[', ']',
         ';', ',', ':', '.'
-    }
+    })
+    
+    # One shared string object per keyword/operator/delimiter value
+    _INTERNED = {s: sys.intern(s) for s in KEYWORDS | OPERATORS | DELIMITERS}
     
     def __init__(self, source_code: str):
         """
@@ -98,207 +145,114 @@ class Lexer:
         self.source = source_code
         self.position = 0
         self.line_number = 1
-        self.current_char = self.source[0] if source_code else None
         self.tokens: List[Token] = []
     
-    def advance(self) -> None:
-        """Move to the next character in the source code."""
-        self.position += 1
-        if self.position >= len(self.source):
-            self.current_char = None
-        else:
-            self.current_char = self.source[self.position]
-            if self.current_char == '\n':
-                self.line_number += 1
-    
-    def peek(self, offset: int = 1) -> Optional[str]:
+    def _token_from_match(self, match: 're.Match[str]') -> Optional[Token]:
         """
-        Look ahead at the next character without advancing.
+        Convert a match of the master token pattern into a token.
+        
+        Advances position and line_number past the matched text.
         
         Args:
-            offset: How many characters ahead to look
+            match: Match object produced by _TOKEN_RE
             
         Returns:
-            The character at position + offset, or None if out of bounds
-        """
-        peek_pos = self.position + offset
-        if peek_pos < len(self.source):
-            return self.source[peek_pos]
-        return None
-    
-    def skip_whitespace(self) -> None:
-        """Skip whitespace characters (except newlines in some contexts)."""
-        while self.current_char is not None and self.current_char in ' \t\r\n':
-            self.advance()
-    
-    def skip_comment(self) -> None:
-        """Skip single-line comments (// style)."""
-        if self.current_char == '/' and self.peek() == '/':
-            # Skip until end of line
-            while self.current_char is not None and self.current_char != '\n':
-                self.advance()
-            if self.current_char == '\n':
-                self.advance()
-    
-    def read_number(self) -> Token:
-        """
-        Read a numeric literal (integer or float).
-        
-        Returns:
-            Token representing the number
+            The Token, or None if the match holds no token
         """
-        num_str = ''
-        start_line = self.line_number
-        has_decimal = False
+        source = self.source
+        index = match.lastindex
+        end = match.end()
         
-        while self.current_char is not None and (self.current_char.isdigit() or self.current_char == '.'):
-            if self.current_char == '.':
-                if has_decimal:
-                    break  # Second decimal point, stop
-                has_decimal = True
-            num_str += self.current_char
-            self.advance()
+        # Only whitespace and comments (or nothing) before the end of input
+        # or an unknown character
+        if index is None:
+            self.line_number += source.count('\n', self.position, end)
+            self.position = end
+            return None
         
-        return Token(TokenType.NUMBER, num_str, start_line)
-    
-    def read_string(self) -> Token:
-        """
-        Read a string literal (enclosed in quotes).
+        # Newlines since the previous match (skipped text and characters),
+        # counted on the source itself without slicing
+        start = match.start(index)
+        line = self.line_number + source.count('\n', self.position, start)
+        self.line_number = line
+        self.position = end
         
-        Returns:
-            Token representing the string
-        """
-        start_line = self.line_number
-        quote_char = self.current_char  # ' or "
-        string_value = ''
+        token_type = _GROUP_TYPES[index]
+        if token_type is _TT_STR:
+            self.line_number += source.count('\n', start, end)
+            body = match.group('DQ_BODY')
+            if body is None:
+                body = match.group('SQ_BODY')
+            if '\\' in body:
+                body = _unescape(body)
+            return Token(_TT_STR, body, line)
         
-        self.advance()  # Skip opening quote
+        text = source[start:end]
+        if token_type is _TT_NUM:
+            return Token(_TT_NUM, text, line)
         
-        while self.current_char is not None and self.current_char != quote_char:
-            if self.current_char == '\\':
-                # Handle escape sequences
-                self.advance()
-                if self.current_char in ['n', 't', 'r', '\\', quote_char]:
-                    escape_map = {'n': '\n', 't': '\t', 'r': '\r', '\\': '\\'}
-                    string_value += escape_map.get(self.current_char, self.current_char)
-                    self.advance()
-            else:
-                string_value += self.current_char
-                self.advance()
+        interned = self._INTERNED.get(text)
+        if interned is None:
+            # Identifier names are interned too, matching the symbol table
+            if token_type is _TT_IDENT:
+                text = sys.intern(text)
+            return Token(token_type, text, line)
         
-        if self.current_char == quote_char:
-            self.advance()  # Skip closing quote
+        # Identifiers that are keywords
+        if token_type is _TT_IDENT:
+            token_type = _TT_KEYWORD
         
-        return Token(TokenType.STRING, string_value, start_line)
+        return Token(token_type, interned, line)
     
-    def read_identifier(self) -> Token:
+    def get_next_token(self) -> Token:
         """
-        Read an identifier or keyword.
-        
-        Returns:
-            Token representing identifier or keyword
-        """
-        identifier = ''
-        start_line = self.line_number
-        
-        while self.current_char is not None and (self.current_char.isalnum() or self.current_char == '_'):
-            identifier += self.current_char
-            self.advance()
+        Get the next token from the source code.
         
-        # Check if it's a keyword
-        if identifier in self.KEYWORDS:
-            return Token(TokenType.KEYWORD, identifier, start_line)
-        else:
-            return Token(TokenType.IDENTIFIER, identifier, start_line)
-    
-    def read_operator(self) -> Token:
-        """
-        Read an operator (can be multi-character).
+        Each call matches the master token pattern at the current
+        position; whitespace, comments and unknown characters are skipped.
         
         Returns:
-            Token representing the operator
-        """
-        start_line = self.line_number
-        op = self.current_char
-        self.advance()
-        
-        # Check for two-character operators
-        if self.current_char is not None:
-            two_char_op = op + self.current_char
-            if two_char_op in self.OPERATORS:
-                self.advance()
-                return Token(TokenType.OPERATOR, two_char_op, start_line)
-        
-        return Token(TokenType.OPERATOR, op, start_line)
-    
-    def get_next_token(self) -> Optional[Token]:
+            Next Token, or an EOF token at the end of the source
         """
-        Get the next token from the source code.
+        source = self.source
         
-        Returns:
-            Next Token, or None if end of file
-        """
-        while self.current_char is not None:
-            # Skip whitespace
-            if self.current_char in ' \t\r\n':
-                self.skip_whitespace()
-                continue
-            
-            # Skip comments
-            if self.current_char == '/' and self.peek() == '/':
-                self.skip_comment()
-                continue
-            
-            # Numbers
-            if self.current_char.isdigit():
-                return self.read_number()
-            
-            # Strings
-            if self.current_char in ['"', "'"]:
-                return self.read_string()
-            
-            # Identifiers and keywords
-            if self.current_char.isalpha() or self.current_char == '_':
-                return self.read_identifier()
-            
-            # Delimiters
-            if self.current_char in self.DELIMITERS:
-                delimiter = self.current_char
-                line = self.line_number
-                self.advance()
-                return Token(TokenType.DELIMITER, delimiter, line)
-            
-            # Operators
-            if self.current_char in '+-*/%=!<>&|':
-                return self.read_operator()
+        while self.position < len(source):
+            match = _TOKEN_RE.match(source, self.position)
+            token = self._token_from_match(match)
+            if token is not None:
+                return token
             
             # Unknown character - skip it
-            self.advance()
+            if match.end() == match.start():
+                self.position += 1
         
         # End of file
-        return Token(TokenType.EOF, '', self.line_number)
+        self._finish()
+        return Token(_TT_EOF, '', self.line_number)
     
     def tokenize(self) -> List[Token]:
         """
         Tokenize the entire source code.
         
+        The remaining source is scanned in a single finditer pass, which
+        also skips unknown characters between matches.
+        
         Returns:
             List of all tokens
         """
-        self.tokens = []
+        scan = map(self._token_from_match, _TOKEN_RE.finditer(self.source, self.position))
+        self.tokens = [token for token in scan if token is not None]
         
-        while True:
-            token = self.get_next_token()
-            if token is None:
-                break
-            
-            self.tokens.append(token)
-            
-            if token.type == TokenType.EOF:
-                break
+        self._finish()
+        self.tokens.append(Token(_TT_EOF, '', self.line_number))
         
         return self.tokens
     
+    def _finish(self) -> None:
+        """Move past trailing whitespace and unknown characters."""
+        self.line_number += self.source.count('\n', self.position)
+        self.position = len(self.source)
+    
     def display_tokens(self) -> None:
         """Display all tokens in a formatted manner."""
         print("\n" + "="*60)
@@ -7,9 +7,29 @@ This module implements the parser that analyzes syntax and populates
 the symbol table with semantic information.
 """
 
-from typing import List, Optional
+import sys
+from typing import Dict, List, Optional
 from lexer import Token, TokenType, Lexer
-from symbol_table import SymbolTable
+from symbol_table import SymbolTable, SymbolEntry
+
+
+# Token types bound once at module level for the hot paths
+_TT_KEYWORD = TokenType.KEYWORD
+_TT_IDENT = TokenType.IDENTIFIER
+_TT_OP = TokenType.OPERATOR
+_TT_DELIM = TokenType.DELIMITER
+_TT_EOF = TokenType.EOF
+
+# Keywords that start a declaration
+_TYPE_KEYWORDS = frozenset(map(sys.intern, ('int', 'float', 'string', 'bool')))
+
+# Delimiters that terminate an expression
+_EXPRESSION_END = frozenset((';', ',', ')'))
+
+
+def _is_type_keyword(token: Optional[Token]) -> bool:
+    """Check if a token is one of the type keywords that start a declaration."""
+    return token is not None and token.type is _TT_KEYWORD and token.value in _TYPE_KEYWORDS
 
 
 class ParseError(Exception):
@@ -45,6 +65,8 @@ class Parser:
         self.current_token = self.tokens[0] if tokens else None
         self.symbol_table = SymbolTable()
         self.errors: List[str] = []
+        # Identifiers already resolved, one dict per open block
+        self._scope_cache: List[Dict[str, SymbolEntry]] = [{}]
     
     def advance(self) -> None:
         """Move to the next token."""
@@ -80,28 +102,53 @@ class Parser:
         Returns:
             True if matches, False otherwise
         """
-        if self.current_token is None:
-            return False
-        
-        if self.current_token.type != token_type:
-            return False
-        
-        if value is not None and self.current_token.value != value:
-            return False
-        
-        return True
+        if value is None:
+            return self._expect_type(token_type)
+        return self._expect_tv(token_type, value)
+    
+    def _expect_type(self, token_type: TokenType) -> bool:
+        """Check if current token has the expected type."""
+        token = self.current_token
+        return token is not None and token.type is token_type
+    
+    def _expect_tv(self, token_type: TokenType, value: str) -> bool:
+        """Check if current token has the expected type and value."""
+        token = self.current_token
+        return token is not None and token.type is token_type and token.value == value
     
     def error(self, message: str) -> None:
         """
         Record a parsing error.
         
+        Errors are reported together once parsing finishes.
+        
         Args:
             message: Error message
         """
         line = self.current_token.line_number if self.current_token else "EOF"
-        error_msg = f"Line {line}: {message}"
-        self.errors.append(error_msg)
-        print(f"ERROR: {error_msg}")
+        self.errors.append(f"Line {line}: {message}")
+    
+    def resolve(self, name: str) -> Optional[SymbolEntry]:
+        """
+        Resolve an identifier in the current block.
+        
+        Names are looked up in the symbol table once per block and then
+        served from the block's cache. Each block starts with an empty
+        cache, so entering a block costs nothing extra.
+        
+        Args:
+            name: Identifier name
+            
+        Returns:
+            SymbolEntry if declared, None otherwise
+        """
+        cache = self._scope_cache[-1]
+        symbol = cache.get(name)
+        if symbol is None:
+            symbol = self.symbol_table.lookup(name)
+            if symbol is not None:
+                cache[name] = symbol
+        return symbol
     
     def parse_type(self) -> Optional[str]:
         """
@@ -110,7 +157,7 @@ class Parser:
         Returns:
             Type name if valid, None otherwise
         """
-        if self.expect(TokenType.KEYWORD) and self.current_token.value in ['int', 'float', 'string', 'bool']:
+        if _is_type_keyword(self.current_token):
             type_name = self.current_token.value
             self.advance()
             return type_name
@@ -124,17 +171,22 @@ class Parser:
             Expression value as string, or None if error
         """
         # For simplicity, we'll just capture the expression tokens until semicolon or delimiter
-        expr_tokens = []
+        # Scan with a local index and store the new position once
+        tokens = self.tokens
+        count = len(tokens)
+        start = position = self.position
         
-        while self.current_token and not (
-            self.expect(TokenType.DELIMITER, ';') or 
-            self.expect(TokenType.DELIMITER, ',') or
-            self.expect(TokenType.DELIMITER, ')')
+        while position < count and not (
+            tokens[position].type is _TT_DELIM and tokens[position].value in _EXPRESSION_END
         ):
-            expr_tokens.append(self.current_token.value)
-            self.advance()
+            position += 1
+        
+        if position == start:
+            return None
         
-        return ' '.join(expr_tokens) if expr_tokens else None
+        self.position = position
+        self.current_token = tokens[position] if position < count else None
+        return ' '.join([token.value for token in tokens[start:position]])
     
     def parse_declaration(self) -> bool:
         """
@@ -151,7 +203,7 @@ class Parser:
             return False
         
         # Get identifier
-        if not self.expect(TokenType.IDENTIFIER):
+        if not self._expect_type(_TT_IDENT):
             self.error(f"Expected identifier after type '{var_type}'")
             return False
         
@@ -163,13 +215,13 @@ class Parser:
         value = None
         initialized = False
         
-        if self.expect(TokenType.OPERATOR, '='):
+        if self._expect_tv(_TT_OP, '='):
             self.advance()  # Skip '='
             value = self.parse_expression()
             initialized = True
         
         # Expect semicolon
-        if not self.expect(TokenType.DELIMITER, ';'):
+        if not self._expect_tv(_TT_DELIM, ';'):
             self.error(f"Expected ';' after declaration of '{var_name}'")
             return False
         
@@ -180,6 +232,9 @@ class Parser:
             self.error(f"Duplicate declaration of variable '{var_name}'")
             return False
         
+        # The declaration shadows any outer symbol cached for this block
+        self._scope_cache[-1].pop(var_name, None)
+        
         return True
     
     def parse_assignment(self) -> bool:
@@ -196,13 +251,13 @@ class Parser:
         self.advance()  # Skip identifier
         
         # Check if variable is declared
-        symbol = self.symbol_table.lookup(var_name)
+        symbol = self.resolve(var_name)
         if symbol is None:
             self.error(f"Undeclared variable '{var_name}'")
             return False
         
         # Expect '='
-        if not self.expect(TokenType.OPERATOR, '='):
+        if not self._expect_tv(_TT_OP, '='):
             self.error(f"Expected '=' in assignment")
             return False
         
@@ -212,14 +267,14 @@ class Parser:
         value = self.parse_expression()
         
         # Expect semicolon
-        if not self.expect(TokenType.DELIMITER, ';'):
+        if not self._expect_tv(_TT_DELIM, ';'):
             self.error(f"Expected ';' after assignment")
             return False
         
         self.advance()  # Skip ';'
         
-        # Update symbol table
-        self.symbol_table.update(var_name, value=value, initialized=True)
+        # Update the resolved entry directly
+        self.symbol_table.update_entry(symbol, value=value, initialized=True)
         
         return True
     
@@ -232,20 +287,21 @@ class Parser:
         Returns:
             True if successfully parsed, False otherwise
         """
-        if not self.expect(TokenType.DELIMITER, '{'):
+        if not self._expect_tv(_TT_DELIM, '{'):
             return False
         
         self.advance()  # Skip '{'
         
         # Enter new scope
         self.symbol_table.enter_scope()
+        self._scope_cache.append({})
         
         # Parse statements in block
-        while self.current_token and not self.expect(TokenType.DELIMITER, '}'):
+        while self.current_token and not self._expect_tv(_TT_DELIM, '}'):
             self.parse_statement()
         
         # Expect '}'
-        if not self.expect(TokenType.DELIMITER, '}'):
+        if not self._expect_tv(_TT_DELIM, '}'):
             self.error("Expected '}' to close block")
             return False
         
@@ -253,6 +309,7 @@ class Parser:
         
         # Exit scope
         self.symbol_table.exit_scope()
+        self._scope_cache.pop()
         
         return True
     
@@ -263,19 +320,19 @@ class Parser:
         Returns:
             True if successfully parsed, False otherwise
         """
-        if self.current_token is None or self.expect(TokenType.EOF):
+        if self.current_token is None or self._expect_type(_TT_EOF):
             return False
         
         # Declaration (starts with type keyword)
-        if self.expect(TokenType.KEYWORD) and self.current_token.value in ['int', 'float', 'string', 'bool']:
+        if _is_type_keyword(self.current_token):
             return self.parse_declaration()
         
         # Block
-        if self.expect(TokenType.DELIMITER, '{'):
+        if self._expect_tv(_TT_DELIM, '{'):
             return self.parse_block()
         
         # Assignment (starts with identifier)
-        if self.expect(TokenType.IDENTIFIER):
+        if self._expect_type(_TT_IDENT):
             return self.parse_assignment()
         
         # Skip unknown tokens
@@ -293,10 +350,11 @@ class Parser:
         print("PARSING")
         print("="*60)
         
-        while self.current_token and not self.expect(TokenType.EOF):
+        while self.current_token and not self._expect_type(_TT_EOF):
             self.parse_statement()
         
         if self.errors:
+            print("\n".join([f"ERROR: {error}" for error in self.errors]))
             print(f"\nParsing completed with {len(self.errors)} error(s)")
         else:
             print("\nParsing completed successfully!")
@@ -7,12 +7,19 @@ This module implements the Symbol Table data structure for tracking
 program identifiers during compilation.
 """
 
-from typing import Optional, Dict, List, Any
+from __future__ import annotations
+
+import sys
+from types import MappingProxyType
+from typing import Optional, Any, Mapping
 from dataclasses import dataclass, field
-from datetime import datetime
 
 
-@dataclass
+# Default for update() arguments that were not passed
+_UNSET = object()
+
+
+@dataclass(slots=True)
 class SymbolEntry:
     """
     Represents a single entry in the symbol table.
@@ -26,7 +33,9 @@ class SymbolEntry:
         initialized: Whether the variable has been assigned a value
         used: Whether the variable has been referenced
         constant: Whether the symbol is a constant
-        attributes: Additional metadata
+        attributes: Additional metadata; None until metadata is first
+            set, so check for None before reading or adding keys (or go
+            through SymbolTable.update, which creates the dict)
     """
     name: str
     symbol_type: str
@@ -36,7 +45,7 @@ class SymbolEntry:
     initialized: bool = False
     used: bool = False
     constant: bool = False
-    attributes: Dict[str, Any] = field(default_factory=dict)
+    attributes: Optional[dict[str, Any]] = None
     
     def __str__(self) -> str:
         """String representation of symbol entry."""
@@ -44,6 +53,21 @@ class SymbolEntry:
                 f"scope='{self.scope}', line={self.line_number})")
 
 
+@dataclass(slots=True, eq=False)
+class Scope:
+    """
+    A single scope level in the symbol table.
+    
+    Attributes:
+        path: Full scope path (e.g., 'global.function1')
+        parent: Enclosing scope, or None for the global scope
+        symbols: Symbols declared in this scope, in insertion order
+    """
+    path: str
+    parent: Optional[Scope] = field(default=None, repr=False)
+    symbols: dict[str, SymbolEntry] = field(default_factory=dict)
+
+
 class SymbolTable:
     """
     Symbol Table Manager for tracking program identifiers.
@@ -57,17 +81,40 @@ class SymbolTable:
     
     def __init__(self):
         """Initialize an empty symbol table."""
-        self.table: Dict[str, Dict[str, SymbolEntry]] = {}
         self.current_scope: str = "global"
-        self.scope_stack: List[str] = ["global"]
+        self.scope_stack: list[str] = ["global"]
         self.scope_counter: int = 0
+        # Innermost open scope; each scope links to its parent
+        self._current: Scope = Scope("global")
+        # Scopes by full path, in creation order (global is added with
+        # its first symbol)
+        self._scopes: dict[str, Scope] = {}
+        # Statistics counters, kept up to date by insert, lookup, update
+        # and delete
+        self._symbol_count: int = 0
+        self._initialized_count: int = 0
+        self._used_count: int = 0
+        
+    @property
+    def table(self) -> dict[str, Mapping[str, SymbolEntry]]:
+        """
+        Symbols by scope path, as a nested dictionary.
         
+        Built on each access. Each scope's symbols are a read-only
+        mappingproxy, so the table can only be changed through insert,
+        update and delete, which keep the statistics in step.
+        """
+        return {path: MappingProxyType(scope.symbols)
+                for path, scope in self._scopes.items()}
+    
     def _get_full_scope_path(self) -> str:
         """Get the current full scope path (e.g., 'global.function1.block1')."""
-        return ".".join(self.scope_stack)
+        return self._current.path
     
     def insert(self, name: str, symbol_type: str, line_number: int, 
-               value: Optional[Any] = None, **kwargs) -> bool:
+               value: Optional[Any] = None, initialized: Optional[bool] = None,
+               constant: bool = False,
+               attributes: Optional[dict[str, Any]] = None) -> bool:
         """
         Insert a new symbol into the table.
         
@@ -76,24 +123,29 @@ class SymbolTable:
             symbol_type: Data type of the symbol
             line_number: Line number where declared
             value: Optional initial value
-            **kwargs: Additional attributes (initialized, constant, etc.)
+            initialized: Whether the symbol has a value (defaults to value is not None)
+            constant: Whether the symbol is a constant
+            attributes: Optional additional metadata
             
         Returns:
             True if insertion successful, False if symbol already exists in current scope
         """
-        scope = self._get_full_scope_path()
+        # Interned names let dict probes match on identity
+        name = sys.intern(name)
+        current = self._current
+        scope = current.path
         
         # Check for duplicate declaration in current scope
-        if scope in self.table and name in self.table[scope]:
+        if name in current.symbols:
             return False
         
         # Create scope entry if it doesn't exist
-        if scope not in self.table:
-            self.table[scope] = {}
+        if scope not in self._scopes:
+            self._scopes[scope] = current
         
         # Create symbol entry
-        initialized = kwargs.get('initialized', value is not None)
-        constant = kwargs.get('constant', False)
+        if initialized is None:
+            initialized = value is not None
         
         symbol = SymbolEntry(
             name=name,
@@ -103,13 +155,17 @@ class SymbolTable:
             value=value,
             initialized=initialized,
             constant=constant,
-            attributes=kwargs.get('attributes', {})
+            attributes=attributes
         )
         
-        self.table[scope][name] = symbol
+        current.symbols[name] = symbol
+        self._symbol_count += 1
+        if initialized:
+            self._initialized_count += 1
         return True
     
-    def lookup(self, name: str, scope: Optional[str] = None) -> Optional[SymbolEntry]:
+    def lookup(self, name: str, scope: Optional[str] = None, *,
+               mark_used: bool = True) -> Optional[SymbolEntry]:
         """
         Look up a symbol in the table.
         
@@ -119,38 +175,48 @@ class SymbolTable:
         Args:
             name: Identifier name to search for
             scope: Optional specific scope to search (defaults to current scope)
+            mark_used: Whether a symbol found in the current or parent
+                scopes is marked as used
             
         Returns:
             SymbolEntry if found, None otherwise
         """
         if scope is not None:
             # Search specific scope only
-            if scope in self.table and name in self.table[scope]:
-                return self.table[scope][name]
-            return None
+            target = self._scopes.get(scope)
+            if target is None:
+                return None
+            return target.symbols.get(name)
         
         # Search current scope and parent scopes
-        scopes_to_search = []
-        for i in range(len(self.scope_stack), 0, -1):
-            scope_path = ".".join(self.scope_stack[:i])
-            scopes_to_search.append(scope_path)
-        
-        for scope_path in scopes_to_search:
-            if scope_path in self.table and name in self.table[scope_path]:
-                symbol = self.table[scope_path][name]
-                # Mark as used
-                symbol.used = True
+        current = self._current
+        while current is not None:
+            symbol = current.symbols.get(name)
+            if symbol is not None:
+                # Mark as used (only the first time)
+                if mark_used and not symbol.used:
+                    symbol.used = True
+                    self._used_count += 1
                 return symbol
+            current = current.parent
         
         return None
     
-    def update(self, name: str, **kwargs) -> bool:
+    def update(self, name: str, value: Any = _UNSET, initialized: Any = _UNSET,
+               used: Any = _UNSET, constant: Any = _UNSET,
+               attributes: Optional[dict[str, Any]] = None) -> bool:
         """
         Update an existing symbol's attributes.
         
+        Only the arguments that are passed are changed.
+        
         Args:
             name: Identifier name
-            **kwargs: Attributes to update (value, initialized, used, etc.)
+            value: New value
+            initialized: Whether the symbol has a value
+            used: Whether the symbol has been referenced
+            constant: Whether the symbol is a constant
+            attributes: Metadata merged into the symbol's attributes
             
         Returns:
             True if update successful, False if symbol not found
@@ -159,20 +225,42 @@ class SymbolTable:
         if symbol is None:
             return False
         
-        # Update attributes
-        if 'value' in kwargs:
-            symbol.value = kwargs['value']
-        if 'initialized' in kwargs:
-            symbol.initialized = kwargs['initialized']
-        if 'used' in kwargs:
-            symbol.used = kwargs['used']
-        if 'constant' in kwargs:
-            symbol.constant = kwargs['constant']
-        if 'attributes' in kwargs:
-            symbol.attributes.update(kwargs['attributes'])
-        
+        self.update_entry(symbol, value=value, initialized=initialized,
+                          used=used, constant=constant, attributes=attributes)
         return True
     
+    def update_entry(self, symbol: SymbolEntry, value: Any = _UNSET,
+                     initialized: Any = _UNSET, used: Any = _UNSET,
+                     constant: Any = _UNSET,
+                     attributes: Optional[dict[str, Any]] = None) -> None:
+        """
+        Update a symbol entry already obtained from this table.
+        
+        Same as update, without looking the name up again.
+        
+        Args:
+            symbol: Entry returned by lookup on this table
+            value: New value
+            initialized: Whether the symbol has a value
+            used: Whether the symbol has been referenced
+            constant: Whether the symbol is a constant
+            attributes: Metadata merged into the symbol's attributes
+        """
+        if value is not _UNSET:
+            symbol.value = value
+        if initialized is not _UNSET:
+            self._initialized_count += bool(initialized) - bool(symbol.initialized)
+            symbol.initialized = initialized
+        if used is not _UNSET:
+            self._used_count += bool(used) - bool(symbol.used)
+            symbol.used = used
+        if constant is not _UNSET:
+            symbol.constant = constant
+        if attributes is not None:
+            if symbol.attributes is None:
+                symbol.attributes = {}
+            symbol.attributes.update(attributes)
+    
     def delete(self, name: str, scope: Optional[str] = None) -> bool:
         """
         Delete a symbol from the table.
@@ -184,13 +272,20 @@ class SymbolTable:
         Returns:
             True if deletion successful, False if symbol not found
         """
-        target_scope = scope if scope is not None else self._get_full_scope_path()
+        target = self._current if scope is None else self._scopes.get(scope)
+        if target is None:
+            return False
         
-        if target_scope in self.table and name in self.table[target_scope]:
-            del self.table[target_scope][name]
-            return True
+        symbol = target.symbols.pop(name, None)
+        if symbol is None:
+            return False
         
-        return False
+        self._symbol_count -= 1
+        if symbol.initialized:
+            self._initialized_count -= 1
+        if symbol.used:
+            self._used_count -= 1
+        return True
     
     def enter_scope(self, scope_name: Optional[str] = None) -> str:
         """
@@ -206,11 +301,16 @@ class SymbolTable:
             self.scope_counter += 1
             scope_name = f"block{self.scope_counter}"
         
-        self.scope_stack.append(scope_name)
-        new_scope = self._get_full_scope_path()
+        new_scope = sys.intern(self._current.path + "." + scope_name)
         
-        if new_scope not in self.table:
-            self.table[new_scope] = {}
+        # Re-entering a scope path continues the same scope
+        scope = self._scopes.get(new_scope)
+        if scope is None:
+            scope = self._scopes[new_scope] = Scope(new_scope, self._current)
+        
+        self.scope_stack.append(scope_name)
+        self._current = scope
+        self.current_scope = new_scope
         
         return new_scope
     
@@ -225,9 +325,11 @@ class SymbolTable:
             return None  # Can't exit global scope
         
         exited_scope = self.scope_stack.pop()
+        self._current = self._current.parent
+        self.current_scope = self._current.path
         return exited_scope
     
-    def get_symbols_in_scope(self, scope: Optional[str] = None) -> List[SymbolEntry]:
+    def get_symbols_in_scope(self, scope: Optional[str] = None) -> list[SymbolEntry]:
         """
         Get all symbols in a specific scope.
         
@@ -237,14 +339,14 @@ class SymbolTable:
         Returns:
             List of SymbolEntry objects in the scope
         """
-        target_scope = scope if scope is not None else self._get_full_scope_path()
+        target = self._current if scope is None else self._scopes.get(scope)
         
-        if target_scope in self.table:
-            return list(self.table[target_scope].values())
+        if target is not None:
+            return list(target.symbols.values())
         
         return []
     
-    def get_all_symbols(self) -> List[SymbolEntry]:
+    def get_all_symbols(self) -> list[SymbolEntry]:
         """
         Get all symbols from all scopes.
         
@@ -252,41 +354,48 @@ class SymbolTable:
             List of all SymbolEntry objects
         """
         all_symbols = []
-        for scope_symbols in self.table.values():
-            all_symbols.extend(scope_symbols.values())
+        for scope in self._scopes.values():
+            all_symbols.extend(scope.symbols.values())
         return all_symbols
     
-    def display(self, show_unused: bool = True) -> None:
+    def display(self, show_unused: bool = True, sort: bool = False) -> None:
         """
         Display the symbol table in a formatted manner.
         
+        Scopes are listed in creation order and symbols in declaration
+        order, unless sort is set.
+        
         Args:
             show_unused: Whether to show unused variables
+            sort: Whether to list scopes and symbols alphabetically
         """
-        print("\n" + "="*80)
-        print("SYMBOL TABLE")
-        print("="*80)
+        # Collect all lines and write them in one call
+        lines = ["\n" + "="*80, "SYMBOL TABLE", "="*80]
+        append = lines.append
         
-        if not self.table:
-            print("(empty)")
+        if not self._scopes:
+            append("(empty)")
+            sys.stdout.write("\n".join(lines) + "\n")
             return
         
-        # Sort scopes for consistent display
-        sorted_scopes = sorted(self.table.keys())
+        separator = "-" * 80
+        header = f"{'Name':<15} {'Type':<10} {'Line':<6} {'Init':<6} {'Used':<6} {'Value':<15}"
         
-        for scope in sorted_scopes:
-            symbols = self.table[scope]
+        scopes = self._scopes
+        scope_paths = sorted(scopes) if sort else scopes
+        
+        for scope in scope_paths:
+            symbols = scopes[scope].symbols
             if not symbols:
                 continue
             
-            print(f"\nScope: {scope}")
-            print("-" * 80)
-            print(f"{'Name':<15} {'Type':<10} {'Line':<6} {'Init':<6} {'Used':<6} {'Value':<15}")
-            print("-" * 80)
+            append(f"\nScope: {scope}")
+            append(separator)
+            append(header)
+            append(separator)
             
-            for name in sorted(symbols.keys()):
-                symbol = symbols[name]
-                
+            entries = [symbols[name] for name in sorted(symbols)] if sort else symbols.values()
+            for symbol in entries:
                 if not show_unused and not symbol.used:
                     continue
                 
@@ -294,37 +403,31 @@ class SymbolTable:
                 if len(value_str) > 15:
                     value_str = value_str[:12] + "..."
                 
-                print(f"{symbol.name:<15} {symbol.symbol_type:<10} "
-                      f"{symbol.line_number:<6} {str(symbol.initialized):<6} "
-                      f"{str(symbol.used):<6} {value_str:<15}")
+                append(f"{symbol.name:<15} {symbol.symbol_type:<10} "
+                       f"{symbol.line_number:<6} {str(symbol.initialized):<6} "
+                       f"{str(symbol.used):<6} {value_str:<15}")
         
-        print("="*80)
+        append("="*80)
+        sys.stdout.write("\n".join(lines) + "\n")
     
-    def get_statistics(self) -> Dict[str, int]:
+    def get_statistics(self) -> dict[str, int]:
         """
         Get statistics about the symbol table.
         
+        The counts are maintained as the table changes, so this does not
+        scan the symbols; they follow changes made through insert,
+        lookup, update, update_entry and delete. Assigning to a
+        SymbolEntry's initialized or used field directly bypasses them.
+        
         Returns:
             Dictionary with statistics (total symbols, scopes, etc.)
         """
-        total_symbols = sum(len(symbols) for symbols in self.table.values())
-        initialized_count = sum(
-            1 for symbols in self.table.values() 
-            for symbol in symbols.values() 
-            if symbol.initialized
-        )
-        used_count = sum(
-            1 for symbols in self.table.values() 
-            for symbol in symbols.values() 
-            if symbol.used
-        )
-        
         return {
-            'total_symbols': total_symbols,
-            'total_scopes': len(self.table),
-            'initialized': initialized_count,
-            'used': used_count,
-            'unused': total_symbols - used_count
+            'total_symbols': self._symbol_count,
+            'total_scopes': len(self._scopes),
+            'initialized': self._initialized_count,
+            'used': self._used_count,
+            'unused': self._symbol_count - self._used_count
         }
     
     def __str__(self) -> str:
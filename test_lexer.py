@@ -0,0 +1,157 @@
+"""
+Unit Tests for the Lexical Analyzer
+Group 6: Compiler Construction Project
+Course: CSCS4573
+
+This module contains unit tests for the lexer's tokenization.
+"""
+
+import unittest
+from lexer import Lexer, Token, TokenType
+
+
+def lex(source):
+    """Tokenize source and return (type name, value, line) tuples."""
+    return [(token.type.name, token.value, token.line_number)
+            for token in Lexer(source).tokenize()]
+
+
+class TestLexer(unittest.TestCase):
+    """Test cases for tokenization."""
+    
+    def test_declaration(self):
+        """Test tokenizing a simple declaration."""
+        self.assertEqual(lex("int x = 10;"), [
+            ('KEYWORD', 'int', 1),
+            ('IDENTIFIER', 'x', 1),
+            ('OPERATOR', '=', 1),
+            ('NUMBER', '10', 1),
+            ('DELIMITER', ';', 1),
+            ('EOF', '', 1),
+        ])
+    
+    def test_multi_character_operators(self):
+        """Test that two-character operators are one token."""
+        values = [value for _, value, _ in lex("a == b != c <= d && e")]
+        self.assertEqual(values, ['a', '==', 'b', '!=', 'c', '<=', 'd', '&&', 'e', ''])
+    
+    def test_line_numbers(self):
+        """Test line numbers across lines, including a leading newline."""
+        self.assertEqual(lex("\nint x;\n\ny"), [
+            ('KEYWORD', 'int', 2),
+            ('IDENTIFIER', 'x', 2),
+            ('DELIMITER', ';', 2),
+            ('IDENTIFIER', 'y', 4),
+            ('EOF', '', 4),
+        ])
+    
+    def test_comments(self):
+        """Test that comments are skipped."""
+        self.assertEqual(lex("x // comment"), [('IDENTIFIER', 'x', 1), ('EOF', '', 1)])
+        self.assertEqual(lex("// only a comment"), [('EOF', '', 1)])
+        self.assertEqual(lex("a // comment\nb"), [
+            ('IDENTIFIER', 'a', 1),
+            ('IDENTIFIER', 'b', 2),
+            ('EOF', '', 2),
+        ])
+    
+    def test_slash_after_comment(self):
+        """Test a lone '/' next to comments and at the end of input."""
+        self.assertEqual(lex("a//b\n//c\n/d"), [
+            ('IDENTIFIER', 'a', 1),
+            ('OPERATOR', '/', 3),
+            ('IDENTIFIER', 'd', 3),
+            ('EOF', '', 3),
+        ])
+        self.assertEqual(lex("a/"), [('IDENTIFIER', 'a', 1), ('OPERATOR', '/', 1), ('EOF', '', 1)])
+        self.assertEqual(lex("a/b")[1], ('OPERATOR', '/', 1))
+    
+    def test_unknown_characters_skipped(self):
+        """Test that unknown characters are skipped."""
+        self.assertEqual(lex("a @ b"), [
+            ('IDENTIFIER', 'a', 1),
+            ('IDENTIFIER', 'b', 1),
+            ('EOF', '', 1),
+        ])
+        self.assertEqual(lex("#x"), [('IDENTIFIER', 'x', 1), ('EOF', '', 1)])
+        self.assertEqual(lex("@"), [('EOF', '', 1)])
+        self.assertEqual(lex("\\"), [('EOF', '', 1)])
+    
+    def test_strings(self):
+        """Test string literals and escape sequences."""
+        self.assertEqual(lex('"hello"')[0], ('STRING', 'hello', 1))
+        self.assertEqual(lex("'hi'")[0], ('STRING', 'hi', 1))
+        self.assertEqual(lex('"a\\nb\\tc"')[0], ('STRING', 'a\nb\tc', 1))
+        self.assertEqual(lex('"\\q\\""')[0], ('STRING', 'q"', 1))
+        self.assertEqual(lex("'it\\'s'")[0], ('STRING', "it's", 1))
+    
+    def test_unterminated_strings(self):
+        """Test strings that run to the end of input."""
+        self.assertEqual(lex('"abc'), [('STRING', 'abc', 1), ('EOF', '', 1)])
+        self.assertEqual(lex('"ab\\'), [('STRING', 'ab', 1), ('EOF', '', 1)])
+    
+    def test_multiline_string(self):
+        """Test that newlines inside a string advance the line number."""
+        self.assertEqual(lex('"a\nb" x'), [
+            ('STRING', 'a\nb', 1),
+            ('IDENTIFIER', 'x', 2),
+            ('EOF', '', 2),
+        ])
+    
+    def test_numbers(self):
+        """Test integer and decimal numbers."""
+        self.assertEqual(lex("3.14")[0], ('NUMBER', '3.14', 1))
+        self.assertEqual(lex("3."), [('NUMBER', '3.', 1), ('EOF', '', 1)])
+        self.assertEqual(lex("1..2"), [
+            ('NUMBER', '1.', 1),
+            ('DELIMITER', '.', 1),
+            ('NUMBER', '2', 1),
+            ('EOF', '', 1),
+        ])
+    
+    def test_get_next_token_matches_tokenize(self):
+        """Test that get_next_token produces the same tokens as tokenize."""
+        sources = [
+            "int x = 10;\n// comment\nfloat y = x / 2.;",
+            '\n\nstring s = "a\\nb\nc"; @ # y',
+            "a//b\n//c\n/d",
+            '"unterminated\n x',
+            "",
+        ]
+        for source in sources:
+            with self.subTest(source=source):
+                lexer = Lexer(source)
+                tokens = []
+                while True:
+                    token = lexer.get_next_token()
+                    tokens.append(token)
+                    if token.type is TokenType.EOF:
+                        break
+                self.assertEqual(tokens, Lexer(source).tokenize())
+    
+    def test_token_string_representation(self):
+        """Test string representation of a token."""
+        token = Token(TokenType.IDENTIFIER, "x", 3)
+        self.assertEqual(str(token), "Token(IDENTIFIER, 'x', line=3)")
+
+
+def run_tests():
+    """Run all tests and display results."""
+    print("\n" + "="*70)
+    print("LEXICAL ANALYZER - UNIT TESTS")
+    print("="*70)
+    
+    # Create test suite
+    loader = unittest.TestLoader()
+    suite = loader.loadTestsFromTestCase(TestLexer)
+    
+    # Run tests
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    success = run_tests()
+    exit(0 if success else 1)
@@ -0,0 +1,85 @@
+"""
+Unit Tests for the Parser and Semantic Analyzer
+Group 6: Compiler Construction Project
+Course: CSCS4573
+
+This module contains unit tests for name resolution in the parser.
+"""
+
+import io
+import unittest
+from contextlib import redirect_stdout
+from lexer import Lexer
+from parser import Parser
+
+
+def parse(source):
+    """Parse source quietly and return the parser."""
+    parser = Parser(Lexer(source).tokenize())
+    with redirect_stdout(io.StringIO()):
+        parser.parse()
+    return parser
+
+
+class TestParser(unittest.TestCase):
+    """Test cases for assignments resolving to the right declaration."""
+    
+    def test_assignment_updates_symbol(self):
+        """Test that an assignment updates the declared symbol."""
+        parser = parse("int x; x = 5;")
+        st = parser.symbol_table
+        
+        self.assertEqual(parser.get_errors(), [])
+        symbol = st.lookup("x", scope="global")
+        self.assertEqual(symbol.value, "5")
+        self.assertTrue(symbol.initialized)
+        self.assertTrue(symbol.used)
+        self.assertEqual(st.get_statistics()['initialized'], 1)
+    
+    def test_redeclaration_after_use_in_block(self):
+        """Test that a local declaration shadows a name already used in the block."""
+        parser = parse("int x = 0; { x = 1; int x; x = 2; }")
+        st = parser.symbol_table
+        
+        self.assertEqual(parser.get_errors(), [])
+        self.assertEqual(st.lookup("x", scope="global").value, "1")
+        self.assertEqual(st.lookup("x", scope="global.block1").value, "2")
+    
+    def test_nested_block_shadows_outer_entry(self):
+        """Test shadowing in a nested block that already used the outer entry."""
+        parser = parse("int x; { x = 1; { x = 2; int x; x = 3; } x = 4; }")
+        st = parser.symbol_table
+        
+        self.assertEqual(parser.get_errors(), [])
+        self.assertEqual(st.lookup("x", scope="global").value, "4")
+        self.assertEqual(st.lookup("x", scope="global.block1.block2").value, "3")
+    
+    def test_block_names_dropped_on_exit(self):
+        """Test that names declared in a block are not visible after it."""
+        parser = parse("{ int y; y = 1; } y = 2;")
+        
+        self.assertEqual(len(parser.get_errors()), 1)
+        self.assertIn("Undeclared variable 'y'", parser.get_errors()[0])
+        self.assertEqual(parser.symbol_table.lookup("y", scope="global.block1").value, "1")
+
+
+def run_tests():
+    """Run all tests and display results."""
+    print("\n" + "="*70)
+    print("PARSER - UNIT TESTS")
+    print("="*70)
+    
+    # Create test suite
+    loader = unittest.TestLoader()
+    suite = loader.loadTestsFromTestCase(TestParser)
+    
+    # Run tests
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    success = run_tests()
+    exit(0 if success else 1)
@@ -6,7 +6,9 @@ Course: CSCS4573
 This module contains unit tests for the symbol table operations.
 """
 
+import io
 import unittest
+from contextlib import redirect_stdout
 from symbol_table import SymbolTable, SymbolEntry
 
 
@@ -29,6 +31,20 @@ class TestSymbolTable(unittest.TestCase):
         self.assertEqual(symbol.symbol_type, "int")
         self.assertEqual(symbol.value, 10)
     
+    def test_insert_options(self):
+        """Test the optional insert parameters."""
+        self.st.insert("x", "int", 1)
+        self.st.insert("y", "int", 2, value=None, initialized=True)
+        self.st.insert("z", "int", 3, value=5, constant=True, attributes={"size": 4})
+        
+        self.assertFalse(self.st.lookup("x").initialized)
+        self.assertTrue(self.st.lookup("y").initialized)
+        
+        symbol = self.st.lookup("z")
+        self.assertTrue(symbol.initialized)
+        self.assertTrue(symbol.constant)
+        self.assertEqual(symbol.attributes, {"size": 4})
+    
     def test_duplicate_declaration(self):
         """Test that duplicate declarations are rejected."""
         self.st.insert("x", "int", 1)
@@ -52,6 +68,19 @@ class TestSymbolTable(unittest.TestCase):
         symbol_z = self.st.lookup("z")
         self.assertIsNone(symbol_z)
     
+    def test_lookup_without_marking_used(self):
+        """Test that lookup can leave a symbol unused."""
+        self.st.insert("x", "int", 1)
+        
+        symbol = self.st.lookup("x", mark_used=False)
+        self.assertIsNotNone(symbol)
+        self.assertFalse(symbol.used)
+        self.assertEqual(self.st.get_statistics()['used'], 0)
+        
+        self.st.lookup("x")
+        self.assertTrue(symbol.used)
+        self.assertEqual(self.st.get_statistics()['used'], 1)
+    
     def test_update_symbol(self):
         """Test updating symbol attributes."""
         self.st.insert("x", "int", 1)
@@ -64,6 +93,25 @@ class TestSymbolTable(unittest.TestCase):
         self.assertEqual(symbol.value, 20)
         self.assertTrue(symbol.initialized)
     
+    def test_update_entry(self):
+        """Test updating a looked-up entry without naming it again."""
+        self.st.insert("x", "int", 1)
+        symbol = self.st.lookup("x")
+        
+        self.st.update_entry(symbol, value=5, initialized=True)
+        self.assertEqual(symbol.value, 5)
+        self.assertTrue(symbol.initialized)
+        self.assertEqual(self.st.get_statistics()['initialized'], 1)
+    
+    def test_update_attributes(self):
+        """Test that the attributes dict is created on first update."""
+        self.st.insert("x", "int", 1)
+        self.assertIsNone(self.st.lookup("x").attributes)
+        
+        self.st.update("x", attributes={"size": 4})
+        self.st.update("x", attributes={"align": 4})
+        self.assertEqual(self.st.lookup("x").attributes, {"size": 4, "align": 4})
+    
     def test_delete_symbol(self):
         """Test deleting symbols."""
         self.st.insert("x", "int", 1)
@@ -146,6 +194,37 @@ class TestSymbolTable(unittest.TestCase):
         self.assertIsNotNone(self.st.lookup("global_var"))
         self.assertIsNone(self.st.lookup("level1_var"))
     
+    def test_current_scope_path(self):
+        """Test that the current scope path follows enter/exit."""
+        self.assertEqual(self.st.current_scope, "global")
+        
+        self.assertEqual(self.st.enter_scope("level1"), "global.level1")
+        self.assertEqual(self.st.enter_scope("level2"), "global.level1.level2")
+        self.assertEqual(self.st.current_scope, "global.level1.level2")
+        
+        self.st.exit_scope()
+        self.assertEqual(self.st.current_scope, "global.level1")
+        
+        self.st.exit_scope()
+        self.assertEqual(self.st.current_scope, "global")
+    
+    def test_table_view(self):
+        """Test the nested dictionary view of the table."""
+        self.st.insert("x", "int", 1)
+        self.st.enter_scope("block1")
+        self.st.insert("y", "float", 2)
+        
+        table = self.st.table
+        self.assertEqual(list(table), ["global", "global.block1"])
+        self.assertIs(table["global"]["x"], self.st.lookup("x"))
+        self.assertEqual(list(table["global.block1"]), ["y"])
+        
+        with self.assertRaises(TypeError):
+            del table["global"]["x"]
+        with self.assertRaises(TypeError):
+            table["global"]["z"] = table["global"]["x"]
+        self.assertIsNotNone(self.st.lookup("x"))
+    
     def test_get_symbols_in_scope(self):
         """Test retrieving all symbols in a scope."""
         self.st.insert("x", "int", 1)
@@ -160,6 +239,21 @@ class TestSymbolTable(unittest.TestCase):
         symbols = self.st.get_symbols_in_scope()
         self.assertEqual(len(symbols), 1)
     
+    def test_display_order(self):
+        """Test display in declaration order and in alphabetical order."""
+        self.st.insert("y", "int", 1)
+        self.st.insert("x", "int", 2)
+        
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.st.display()
+        self.assertLess(output.getvalue().index("y "), output.getvalue().index("x "))
+        
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.st.display(sort=True)
+        self.assertLess(output.getvalue().index("x "), output.getvalue().index("y "))
+    
     def test_statistics(self):
         """Test symbol table statistics."""
         self.st.insert("x", "int", 1, value=10)
@@ -175,6 +269,63 @@ class TestSymbolTable(unittest.TestCase):
         self.assertEqual(stats['initialized'], 2)
         self.assertEqual(stats['used'], 1)
         self.assertEqual(stats['unused'], 2)
+    
+    def test_statistics_after_update_and_delete(self):
+        """Test that statistics follow updates and deletions."""
+        self.st.insert("x", "int", 1, value=10)
+        self.st.insert("y", "float", 2)
+        self.st.lookup("x")
+        
+        self.st.update("y", initialized=True)
+        stats = self.st.get_statistics()
+        self.assertEqual(stats['initialized'], 2)
+        self.assertEqual(stats['used'], 2)  # update looks the symbol up
+        
+        self.st.update("y", used=False)
+        self.st.delete("x")
+        stats = self.st.get_statistics()
+        self.assertEqual(stats['total_symbols'], 1)
+        self.assertEqual(stats['initialized'], 1)
+        self.assertEqual(stats['used'], 0)
+        self.assertEqual(stats['unused'], 1)
+    
+    def assertStatisticsMatchSymbols(self):
+        """Check the maintained statistics against a recount of all symbols."""
+        symbols = self.st.get_all_symbols()
+        used = sum(1 for symbol in symbols if symbol.used)
+        self.assertEqual(self.st.get_statistics(), {
+            'total_symbols': len(symbols),
+            'total_scopes': len(self.st.table),
+            'initialized': sum(1 for symbol in symbols if symbol.initialized),
+            'used': used,
+            'unused': len(symbols) - used
+        })
+    
+    def test_statistics_match_recount(self):
+        """Test that statistics match a recount after mixed operations."""
+        steps = [
+            lambda: self.st.insert("x", "int", 1, value=1),
+            lambda: self.st.insert("y", "float", 2),
+            lambda: self.st.lookup("y", mark_used=False),
+            lambda: self.st.enter_scope("block1"),
+            lambda: self.st.insert("x", "string", 3),
+            lambda: self.st.lookup("x"),
+            lambda: self.st.update("y", value=2, initialized=True),
+            lambda: self.st.update("x", used=False, initialized=False),
+            lambda: self.st.update_entry(self.st.lookup("y"), used=True),
+            lambda: self.st.delete("x"),
+            lambda: self.st.insert("x", "int", 4, initialized=True),
+            lambda: self.st.exit_scope(),
+            lambda: self.st.delete("y", scope="global"),
+            lambda: self.st.insert("y", "bool", 5),
+            lambda: self.st.update("x", initialized=False),
+            lambda: self.st.delete("x", scope="global.block1"),
+            lambda: self.st.delete("missing"),
+            lambda: self.st.update("missing", used=True),
+        ]
+        for step in steps:
+            step()
+            self.assertStatisticsMatchSymbols()
 
 
 class TestSymbolEntry(unittest.TestCase):